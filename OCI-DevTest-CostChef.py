@@ -32,16 +32,27 @@ Version: 1.0
 
 import argparse
 import csv
+import functools
+import hashlib
 import json
 import logging
 import os
+import pickle
 import sys
+import time
 import webbrowser
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from html import escape
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Any
 
 try:
     import oci
+    # The SDK vendors its own requests; standalone requests is not a declared
+    # dependency of the oci package, so use the vendored copy
+    from oci._vendor.requests.adapters import HTTPAdapter
     from oci.config import from_file
     from oci.core import ComputeClient, BlockstorageClient, VirtualNetworkClient
     from oci.database import DatabaseClient
@@ -51,40 +62,383 @@ except ImportError:
     print("❌ OCI Python SDK not found. Install with: pip install oci")
     sys.exit(1)
 
+# Optional: decode the SDK's multi-MB list responses with a C JSON parser when
+# one is installed. The base client resolves json.loads through its own module
+# namespace, so rebinding the name there is enough — the stdlib json module
+# itself is left untouched (its dumps still handles request serialization).
+try:
+    import orjson as _fast_json
+except ImportError:
+    try:
+        import ujson as _fast_json
+    except ImportError:
+        _fast_json = None
+
+if _fast_json is not None and getattr(oci.base_client, 'json', None) is not None:
+    import types as _types
+
+    def _fast_loads(s, strict=True):
+        # The base client calls json.loads(data, strict=...); orjson/ujson
+        # accept no keyword arguments, so take the fast path only for the
+        # default strict decode and defer the rest to the stdlib
+        if strict:
+            return _fast_json.loads(s)
+        return json.loads(s, strict=strict)
+
+    oci.base_client.json = _types.SimpleNamespace(
+        loads=_fast_loads,
+        dumps=json.dumps,
+        JSONDecodeError=json.JSONDecodeError
+    )
+
+# Placeholder for absent values, shared so hot loops don't rebuild it
+_NA = 'N/A'
+
+# Cost optimization criteria (frozensets so membership checks are O(1))
+PRODUCTION_DB_SHAPES = frozenset({
+    'VM.Standard2.2', 'VM.Standard2.4', 'VM.Standard2.8', 'VM.Standard2.16', 'VM.Standard2.24',
+    'VM.Standard3.2', 'VM.Standard3.4', 'VM.Standard3.8', 'VM.Standard3.16', 'VM.Standard3.24',
+    'BM.Standard2.52', 'BM.Standard3.64', 'BM.HighIO1.36',
+    'VM.Standard.E3.2', 'VM.Standard.E3.4', 'VM.Standard.E3.8'
+})
+
+OVERSIZED_COMPUTE_SHAPES = frozenset({
+    'VM.Standard2.2', 'VM.Standard2.4', 'VM.Standard2.8', 'VM.Standard2.16', 'VM.Standard2.24',
+    'VM.Standard3.2', 'VM.Standard3.4', 'VM.Standard3.8', 'VM.Standard3.16', 'VM.Standard3.24',
+    'VM.DenseIO2.8', 'VM.DenseIO2.16', 'VM.DenseIO2.24',
+    'VM.GPU3.1', 'VM.GPU3.2', 'VM.GPU3.4',
+    'BM.Standard2.52', 'BM.Standard3.64'
+})
+
+DEV_TEST_TAG_VALUES = frozenset({'dev', 'test', 'development', 'testing', 'staging', 'qa'})
+
+# Lowercase substrings matched against tag keys
+AUTOMATION_TAG_KEYS = ('auto-shutdown', 'auto-start', 'schedule', 'stop-start', 'automation')
+
+# Ports that should never be open to the whole internet, even in dev/test
+_RISKY_PORTS = frozenset({22, 3389})
+
+# Sources that mean "the whole internet", IPv4 and IPv6
+_PERMISSIVE_CIDRS = frozenset({'0.0.0.0/0', '::/0'})
+
+# How long a cached list response stays fresh on disk
+_CACHE_TTL_SECONDS = 1800
+
+
+def _freeze_tags(resource: Any) -> tuple:
+    """Build a hashable key from a resource's freeform and defined tags.
+
+    Many resources share identical tag sets (cost-center namespaces stamped
+    across every VM), so the scans below are memoized on this key.
+    """
+    freeform = getattr(resource, 'freeform_tags', None) or {}
+    defined = getattr(resource, 'defined_tags', None) or {}
+    return (
+        tuple(sorted(freeform.items())),
+        tuple(sorted((ns, tuple(sorted(tags.items()))) for ns, tags in defined.items()))
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_dev_test_tagged(tag_key: tuple) -> bool:
+    """Whether any tag value in the frozen tag set marks a dev/test resource."""
+    freeform, defined = tag_key
+    values = [value for _, value in freeform]
+    for _, tags in defined:
+        values.extend(value for _, value in tags)
+    return any(value.lower() in DEV_TEST_TAG_VALUES for value in values)
+
+
+@functools.lru_cache(maxsize=4096)
+def _has_automation_tag_key(tag_key: tuple) -> bool:
+    """Whether any tag key in the frozen tag set looks like an automation tag."""
+    freeform, defined = tag_key
+    keys = [key for key, _ in freeform]
+    for _, tags in defined:
+        keys.extend(key for key, _ in tags)
+    key_blob = ' '.join(keys).lower()
+    return any(auto_key in key_blob for auto_key in AUTOMATION_TAG_KEYS)
+
+
+@functools.lru_cache(maxsize=4096)
+def _escape_value(value: str) -> str:
+    """HTML-escape a cell value, caching repeats (tag blobs, shapes, states)."""
+    return escape(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_frozen_tags(tag_key: tuple) -> str:
+    """Render the frozen tag set for display."""
+    freeform, defined = tag_key
+    tag_strings = [f"{key}={value}" for key, value in freeform]
+    for namespace, tags in defined:
+        tag_strings.extend(f"{namespace}.{key}={value}" for key, value in tags)
+    return '; '.join(tag_strings) if tag_strings else _NA
+
+# CSV file name per finding category
+_CSV_REPORT_NAMES = {
+    'database_instances': 'Database_Production_Shapes',
+    'compute_missing_automation': 'Compute_Missing_Automation_Tags',
+    'oversized_compute': 'Oversized_Compute_Instances',
+    'unattached_volumes': 'Unattached_Block_Volumes',
+    'unused_public_ips': 'Unused_Public_IPs',
+    'empty_load_balancers': 'Empty_Load_Balancers',
+    'permissive_security_lists': 'Permissive_Security_Lists'
+}
+
+# HTML report sections: (category, title, empty message, table header, row template)
+_REPORT_SECTIONS = [
+    ('database_instances',
+     "🗄️ Database Instances Using Production-Grade Shapes",
+     "✅ Excellent! All dev/test database instances are using appropriate shapes.",
+     "<tr><th>Resource Type</th><th>Name</th><th>Shape</th><th>State</th>"
+     "<th>Availability Domain</th><th>CPU Cores</th><th>Tags</th></tr>",
+     ('resource_type', 'name', 'shape', 'lifecycle_state',
+      'availability_domain', 'cpu_core_count', 'tags'),
+     "<tr><td>%s</td><td>%s</td><td class='warning'>%s</td>"
+     "<td>%s</td><td>%s</td><td>%s</td><td>%s</td></tr>"),
+    ('compute_missing_automation',
+     "🖥️ Compute Instances Missing Automation Tags",
+     "✅ All dev/test compute instances have automation tags configured!",
+     "<tr><th>Instance Name</th><th>Shape</th><th>State</th>"
+     "<th>Availability Domain</th><th>Created</th><th>Tags</th></tr>",
+     ('instance_name', 'shape', 'lifecycle_state',
+      'availability_domain', 'time_created', 'tags'),
+     "<tr><td>%s</td><td>%s</td><td>%s</td>"
+     "<td>%s</td><td>%s</td><td>%s</td></tr>"),
+    ('oversized_compute',
+     "🍖 Oversized Compute Instances for Dev/Test",
+     "✅ No oversized compute instances found in dev/test environments!",
+     "<tr><th>Instance Name</th><th>Shape</th><th>State</th>"
+     "<th>Availability Domain</th><th>Created</th><th>Tags</th></tr>",
+     ('instance_name', 'shape', 'lifecycle_state',
+      'availability_domain', 'time_created', 'tags'),
+     "<tr><td>%s</td><td class='warning'>%s</td>"
+     "<td>%s</td><td>%s</td><td>%s</td><td>%s</td></tr>"),
+    ('unattached_volumes',
+     "💽 Unattached Block Volumes",
+     "✅ No unattached block volumes found!",
+     "<tr><th>Volume Name</th><th>Size (GB)</th><th>Type</th>"
+     "<th>Availability Domain</th><th>Created</th><th>Tags</th></tr>",
+     ('volume_name', 'size_gb', 'volume_type',
+      'availability_domain', 'time_created', 'tags'),
+     "<tr><td>%s</td><td>%s</td><td>%s</td>"
+     "<td>%s</td><td>%s</td><td>%s</td></tr>"),
+    ('unused_public_ips',
+     "🌐 Unused Public IP Addresses",
+     "✅ No unused public IP addresses found!",
+     "<tr><th>Public IP Name</th><th>IP Address</th><th>Scope</th>"
+     "<th>Lifetime</th><th>Created</th><th>Tags</th></tr>",
+     ('public_ip_name', 'ip_address', 'scope',
+      'lifetime', 'time_created', 'tags'),
+     "<tr><td>%s</td><td>%s</td><td>%s</td>"
+     "<td>%s</td><td>%s</td><td>%s</td></tr>"),
+    ('empty_load_balancers',
+     "⚖️ Load Balancers with No Backends",
+     "✅ All load balancers have active backends!",
+     "<tr><th>Load Balancer Name</th><th>Shape</th><th>State</th>"
+     "<th>IP Addresses</th><th>Created</th><th>Tags</th></tr>",
+     ('load_balancer_name', 'shape', 'lifecycle_state',
+      'ip_addresses', 'time_created', 'tags'),
+     "<tr><td>%s</td><td>%s</td><td>%s</td>"
+     "<td>%s</td><td>%s</td><td>%s</td></tr>"),
+    ('permissive_security_lists',
+     "🔓 Permissive Security Lists",
+     "✅ No overly permissive security lists found!",
+     "<tr><th>Security List Name</th><th>VCN Name</th><th>Permissive Rules</th>"
+     "<th>Rule Details</th><th>Tags</th></tr>",
+     ('security_list_name', 'vcn_name', 'permissive_rules_count',
+      'permissive_rules', 'tags'),
+     "<tr><td>%s</td><td>%s</td>"
+     "<td class='warning'>%s</td>"
+     "<td class='warning'>%s</td><td>%s</td></tr>")
+]
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>OCI Dev/Test Resource Cost Chef Report</title>
+    <style>
+        body {
+            font-family: 'Oracle Sans', 'Helvetica Neue', Arial, sans-serif;
+            margin: 20px;
+            background-color: #f7f7f7;
+        }
+        .container {
+            background-color: white;
+            padding: 30px;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }
+        h1, h2 { color: #312d2a; }
+        h1 { border-bottom: 3px solid #ff4800; padding-bottom: 10px; }
+        table {
+            border-collapse: collapse;
+            width: 100%;
+            margin-bottom: 30px;
+        }
+        th, td {
+            border: 1px solid #e0e0e0;
+            padding: 12px;
+            text-align: left;
+        }
+        th {
+            background: linear-gradient(135deg, #312d2a 0%, #ff4800 100%);
+            color: white;
+            font-weight: bold;
+        }
+        tr:nth-child(even) { background-color: #fafafa; }
+        tr:hover { background-color: #fff3e0; }
+        .summary {
+            background: linear-gradient(135deg, #ff4800 0%, #ff6800 100%);
+            color: white;
+            padding: 20px;
+            border-radius: 8px;
+            margin-bottom: 20px;
+        }
+        .warning { color: #d32f2f; font-weight: bold; }
+        .timestamp { color: #666; font-size: 0.9em; }
+        .footer {
+            margin-top: 30px;
+            padding-top: 20px;
+            border-top: 1px solid #e0e0e0;
+            text-align: center;
+            color: #666;
+        }
+        .metric { font-weight: bold; font-size: 1.1em; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🍳 OCI Dev/Test Resource Cost Chef Report</h1>
+"""
+
+_HTML_RECOMMENDATIONS_UL = """
+        <h2>🍽️ Chef's OCI Cost-Saving Recommendations</h2>
+        <ul>
+            <li><strong>🔽 Database Right-Sizing:</strong> Switch to VM.Standard2.1, VM.Standard.E2.1, or Always Free Autonomous DB for dev/test—production power isn't needed for testing recipes.</li>
+            <li><strong>⏱️ Compute Auto-Shutdown:</strong> Tag instances with automation schedules to stop after hours—your OCI bill will thank you for turning off the oven.</li>
+            <li><strong>📏 Compute Right-Sizing:</strong> Use VM.Standard.E2.1.Micro, VM.Standard2.1, or Always Free shapes for dev/test—no need for large servings when a small plate will do.</li>
+            <li><strong>💽 Block Volume Cleanup:</strong> Delete unattached volumes—these orphaned ingredients are still charging you storage fees.</li>
+            <li><strong>🌐 Release Public IPs:</strong> Return unused public IPs to OCI—each idle IP costs money when not attached to resources.</li>
+            <li><strong>⚖️ Load Balancer Cleanup:</strong> Remove load balancers with no backends—empty serving trays cost money without providing value.</li>
+            <li><strong>🔒 Security List Tightening:</strong> Close unnecessary 0.0.0.0/0 rules—keep your dev kitchen secure without leaving doors wide open.</li>
+            <li><strong>💰 Always Free Resources:</strong> Use OCI Always Free tier for long-running dev/test workloads—it's like getting free ingredients forever!</li>
+            <li><strong>📊 Cost Budgets:</strong> Set up OCI Budget alerts to catch cost spikes before they burn your wallet.</li>
+            <li><strong>🏷️ Preemptible Instances:</strong> Use preemptible compute for fault-tolerant dev/test workloads to save up to 50%.</li>
+        </ul>
+        """
+
+_HTML_FOOTER_TMPL = """
+        <div class='footer'>
+            <p>Generated on {report_timestamp}</p>
+            <p>🍳 CloudCostChefs - Serving up OCI savings, one resource at a time</p>
+        </div>
+    </div>
+</body>
+</html>"""
+
+
+def _make_row_renderer(row_fields: tuple, row_template: str):
+    """Specialize a row renderer for one section at module load.
+
+    The field getter and template are bound once as closure locals, so
+    rendering a row is a single itemgetter call plus one %-format —
+    no per-row section lookups.
+    """
+    get_cells = itemgetter(*row_fields)
+
+    def render_rows(data: List[Dict[str, Any]]) -> str:
+        # Resource names and tags are user-controlled; escape them
+        # before they land in the report markup
+        return ''.join(
+            row_template % tuple(_escape_value(str(value))
+                                 for value in get_cells(row))
+            for row in data)
+
+    return render_rows
+
+
+_SECTION_ROW_RENDERERS = {
+    category: _make_row_renderer(row_fields, row_template)
+    for category, _, _, _, row_fields, row_template in _REPORT_SECTIONS
+}
+
+
+def _render_section(title: str, empty_message: str, header_row: str,
+                    render_rows, data: List[Dict[str, Any]]) -> str:
+    """Render one report section: heading plus either the table or the
+    all-clear message when there are no findings."""
+    if not data:
+        return f"<h2>{title}</h2><p>{empty_message}</p>"
+
+    return f"<h2>{title}</h2><table>{header_row}{render_rows(data)}</table>"
+
 
 class OCIDevTestCostChef:
-    def __init__(self, config_path: str = None, profile: str = None):
+    def __init__(self, config_path: str = None, profile: str = None,
+                 auth: str = 'config_file', region: str = None,
+                 no_cache: bool = False):
         """Initialize OCI clients with configuration."""
         self.logger = self._setup_logging()
-        self.config = self._load_oci_config(config_path, profile)
-        
+        self.signer = None
+        self.cache_dir = None if no_cache else '.oci_cache'
+
+        if auth == 'instance_principal':
+            # No key files or config parsing; the signer fetches short-lived
+            # tokens from the instance metadata service
+            try:
+                self.signer = oci.auth.signers.InstancePrincipalsSecurityTokenSigner()
+                self.config = {
+                    'region': region or self.signer.region,
+                    'tenancy': self.signer.tenancy_id
+                }
+                self.logger.info("Using instance principal authentication")
+            except Exception as e:
+                self.logger.error(f"Instance principal authentication failed: {str(e)}")
+                self.logger.error("Run with --auth config_file when outside OCI compute")
+                sys.exit(1)
+        else:
+            self.config = self._load_oci_config(config_path, profile)
+            if region:
+                self.config['region'] = region
+
         # Initialize OCI clients
-        self.compute_client = ComputeClient(self.config)
-        self.blockstorage_client = BlockstorageClient(self.config)
-        self.virtual_network_client = VirtualNetworkClient(self.config)
-        self.database_client = DatabaseClient(self.config)
-        self.load_balancer_client = LoadBalancerClient(self.config)
-        self.identity_client = IdentityClient(self.config)
-        
-        # Define cost optimization criteria
-        self.production_db_shapes = [
-            'VM.Standard2.2', 'VM.Standard2.4', 'VM.Standard2.8', 'VM.Standard2.16', 'VM.Standard2.24',
-            'VM.Standard3.2', 'VM.Standard3.4', 'VM.Standard3.8', 'VM.Standard3.16', 'VM.Standard3.24',
-            'BM.Standard2.52', 'BM.Standard3.64', 'BM.HighIO1.36',
-            'VM.Standard.E3.2', 'VM.Standard.E3.4', 'VM.Standard.E3.8'
-        ]
-        
-        self.oversized_compute_shapes = [
-            'VM.Standard2.2', 'VM.Standard2.4', 'VM.Standard2.8', 'VM.Standard2.16', 'VM.Standard2.24',
-            'VM.Standard3.2', 'VM.Standard3.4', 'VM.Standard3.8', 'VM.Standard3.16', 'VM.Standard3.24',
-            'VM.DenseIO2.8', 'VM.DenseIO2.16', 'VM.DenseIO2.24',
-            'VM.GPU3.1', 'VM.GPU3.2', 'VM.GPU3.4',
-            'BM.Standard2.52', 'BM.Standard3.64'
-        ]
-        
-        self.dev_test_tags = ['dev', 'test', 'development', 'testing', 'staging', 'qa']
-        self.automation_tag_keys = ['auto-shutdown', 'auto-start', 'schedule', 'stop-start', 'automation']
-        
+        client_kwargs = {'signer': self.signer} if self.signer else {}
+        self.compute_client = ComputeClient(self.config, **client_kwargs)
+        self.blockstorage_client = BlockstorageClient(self.config, **client_kwargs)
+        self.virtual_network_client = VirtualNetworkClient(self.config, **client_kwargs)
+        self.database_client = DatabaseClient(self.config, **client_kwargs)
+        self.load_balancer_client = LoadBalancerClient(self.config, **client_kwargs)
+        self.identity_client = IdentityClient(self.config, **client_kwargs)
+
+        # Shared retry policy plus a bigger connection pool so the concurrent
+        # fan-out doesn't exhaust the default adapter or stall on 429
+        # back-offs. The pool is enlarged on each client's own session:
+        # replacing the sessions with one shared object would break
+        # BaseClient._reset_session, which closes and rebuilds the session
+        # it owns and would strand the other clients on a closed one.
+        for client in (self.compute_client, self.blockstorage_client,
+                       self.virtual_network_client, self.database_client,
+                       self.load_balancer_client, self.identity_client):
+            client.retry_strategy = oci.retry.DEFAULT_RETRY_STRATEGY
+            client.base_client.session.mount(
+                'https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+        # Shape criteria (module-level constants, kept as attributes so
+        # callers can still override them per instance). The tag criteria
+        # are not mirrored here: the memoized tag helpers read
+        # DEV_TEST_TAG_VALUES/AUTOMATION_TAG_KEYS at module level, so an
+        # instance attribute would be silently ignored.
+        self.production_db_shapes = PRODUCTION_DB_SHAPES
+        self.oversized_compute_shapes = OVERSIZED_COMPUTE_SHAPES
+
+        # Shared executor for fanning out the per-compartment checks
+        # (OCI clients are thread-safe, each wraps its own requests session)
+        self._check_executor = ThreadPoolExecutor(max_workers=8)
+
         self.logger.info("🍳 CloudCostChefs OCI Dev/Test Cost Chef initialized")
 
     def _setup_logging(self) -> logging.Logger:
@@ -124,7 +478,7 @@ class OCIDevTestCostChef:
                         'lifecycle_state': comp.lifecycle_state
                     })
                 except Exception as e:
-                    self.logger.warning(f"Could not access compartment {comp_id}: {str(e)}")
+                    self.logger.warning("Could not access compartment %s: %s", comp_id, e)
             return compartments
         else:
             # Use root compartment (tenancy)
@@ -140,114 +494,109 @@ class OCIDevTestCostChef:
                 self.logger.error(f"Could not access root compartment: {str(e)}")
                 return []
 
+    def discover_all_compartments(self) -> List[Dict[str, str]]:
+        """Discover every accessible compartment in the tenancy, including the root."""
+        tenancy_id = self.config['tenancy']
+        compartments = self.get_compartments([tenancy_id])
+
+        try:
+            sub_compartments = self._list_all(
+                self.identity_client.list_compartments,
+                tenancy_id,
+                compartment_id_in_subtree=True,
+                access_level='ACCESSIBLE',
+                limit=1000
+            )
+
+            for comp in sub_compartments:
+                compartments.append({
+                    'id': comp.id,
+                    'name': comp.name,
+                    'lifecycle_state': comp.lifecycle_state
+                })
+        except Exception as e:
+            self.logger.warning(f"Could not list child compartments: {str(e)}")
+
+        return compartments
+
     def is_dev_test_resource(self, resource_tags: Dict[str, Any]) -> bool:
         """Check if resource has dev/test tags."""
         if not resource_tags:
             return False
-        
-        # Check freeform tags
-        if hasattr(resource_tags, 'freeform_tags') and resource_tags.freeform_tags:
-            for key, value in resource_tags.freeform_tags.items():
-                if value.lower() in self.dev_test_tags:
-                    return True
-        
-        # Check defined tags
-        if hasattr(resource_tags, 'defined_tags') and resource_tags.defined_tags:
-            for namespace, tags in resource_tags.defined_tags.items():
-                for key, value in tags.items():
-                    if value.lower() in self.dev_test_tags:
-                        return True
-        
-        return False
+        return _is_dev_test_tagged(_freeze_tags(resource_tags))
 
     def has_automation_tags(self, resource_tags: Dict[str, Any]) -> bool:
         """Check if resource has automation tags."""
         if not resource_tags:
             return False
-        
-        # Check freeform tags
-        if hasattr(resource_tags, 'freeform_tags') and resource_tags.freeform_tags:
-            for key in resource_tags.freeform_tags.keys():
-                for auto_key in self.automation_tag_keys:
-                    if auto_key.lower() in key.lower():
-                        return True
-        
-        # Check defined tags
-        if hasattr(resource_tags, 'defined_tags') and resource_tags.defined_tags:
-            for namespace, tags in resource_tags.defined_tags.items():
-                for key in tags.keys():
-                    for auto_key in self.automation_tag_keys:
-                        if auto_key.lower() in key.lower():
-                            return True
-        
-        return False
+        return _has_automation_tag_key(_freeze_tags(resource_tags))
 
     def format_tags(self, resource_tags: Dict[str, Any]) -> str:
         """Format tags for display."""
-        tag_strings = []
-        
-        if hasattr(resource_tags, 'freeform_tags') and resource_tags.freeform_tags:
-            for key, value in resource_tags.freeform_tags.items():
-                tag_strings.append(f"{key}={value}")
-        
-        if hasattr(resource_tags, 'defined_tags') and resource_tags.defined_tags:
-            for namespace, tags in resource_tags.defined_tags.items():
-                for key, value in tags.items():
-                    tag_strings.append(f"{namespace}.{key}={value}")
-        
-        return '; '.join(tag_strings) if tag_strings else 'N/A'
+        return _format_frozen_tags(_freeze_tags(resource_tags))
 
-    def check_database_instances(self, compartment_id: str) -> List[Dict[str, Any]]:
+    def check_database_instances(self, compartment_id: str) -> Iterator[Dict[str, Any]]:
         """Check database instances for production-grade shapes."""
-        results = []
         
         try:
-            self.logger.info(f"Checking database instances in compartment: {compartment_id}")
+            self.logger.info("Checking database instances in compartment: %s", compartment_id)
             
             # Check DB Systems
-            db_systems = self.database_client.list_db_systems(compartment_id=compartment_id).data
+            db_systems = self._list_all(
+                self.database_client.list_db_systems,
+                compartment_id=compartment_id,
+                lifecycle_state='AVAILABLE',
+                limit=1000
+            )
+
+            # Bind the hot lookups to locals for the tight loop
+            production_shapes = self.production_db_shapes
+            is_dev_test = self.is_dev_test_resource
+
             for db_system in db_systems:
-                if (self.is_dev_test_resource(db_system) and 
-                    db_system.shape in self.production_db_shapes and
-                    db_system.lifecycle_state == 'AVAILABLE'):
-                    
-                    results.append({
+                if (is_dev_test(db_system) and
+                    db_system.shape in production_shapes):
+
+                    yield {
                         'resource_type': 'DB System',
                         'name': db_system.display_name,
                         'shape': db_system.shape,
                         'lifecycle_state': db_system.lifecycle_state,
                         'availability_domain': db_system.availability_domain,
-                        'cpu_core_count': getattr(db_system, 'cpu_core_count', 'N/A'),
-                        'database_edition': getattr(db_system, 'database_edition', 'N/A'),
+                        'cpu_core_count': db_system.cpu_core_count if db_system.cpu_core_count is not None else _NA,
+                        'database_edition': db_system.database_edition or _NA,
                         'compartment_id': compartment_id,
                         'tags': self.format_tags(db_system),
                         'resource_id': db_system.id
-                    })
+                    }
             
             # Check Autonomous Databases
-            autonomous_dbs = self.database_client.list_autonomous_databases(compartment_id=compartment_id).data
+            autonomous_dbs = self._list_all(
+                self.database_client.list_autonomous_databases,
+                compartment_id=compartment_id,
+                lifecycle_state='AVAILABLE',
+                limit=1000
+            )
             for adb in autonomous_dbs:
-                if (self.is_dev_test_resource(adb) and 
-                    adb.cpu_core_count >= 4 and  # Consider 4+ cores as production-grade
-                    adb.lifecycle_state == 'AVAILABLE'):
-                    
-                    results.append({
+                if (self.is_dev_test_resource(adb) and
+                    adb.cpu_core_count >= 4):  # Consider 4+ cores as production-grade
+
+                    yield {
                         'resource_type': 'Autonomous Database',
                         'name': adb.display_name,
                         'shape': f"{adb.cpu_core_count} OCPUs",
                         'lifecycle_state': adb.lifecycle_state,
-                        'availability_domain': 'N/A',
+                        'availability_domain': _NA,
                         'cpu_core_count': adb.cpu_core_count,
-                        'database_edition': getattr(adb, 'db_workload', 'N/A'),
+                        'database_edition': adb.db_workload or _NA,
                         'compartment_id': compartment_id,
                         'tags': self.format_tags(adb),
                         'resource_id': adb.id
-                    })
+                    }
                     
         except Exception as e:
-            self.logger.warning(f"Error checking database instances: {str(e)}")
+            self.logger.warning("Error checking database instances: %s", e)
         
-        return results
 
     def check_compute_instances(self, compartment_id: str) -> tuple:
         """Check compute instances for missing automation tags and oversized shapes."""
@@ -255,98 +604,116 @@ class OCIDevTestCostChef:
         oversized_instances = []
         
         try:
-            self.logger.info(f"Checking compute instances in compartment: {compartment_id}")
+            self.logger.info("Checking compute instances in compartment: %s", compartment_id)
             
-            instances = self.compute_client.list_instances(compartment_id=compartment_id).data
+            instances = self._list_all(
+                self.compute_client.list_instances,
+                compartment_id=compartment_id,
+                limit=1000
+            )
+
+            # Bind the hot lookups to locals for the tight loop
+            oversized_shapes = self.oversized_compute_shapes
+            is_dev_test = self.is_dev_test_resource
+            has_automation = self.has_automation_tags
+
             for instance in instances:
-                if (self.is_dev_test_resource(instance) and 
-                    instance.lifecycle_state in ['RUNNING', 'STOPPED']):
-                    
-                    # Check for missing automation tags
-                    if not self.has_automation_tags(instance):
-                        missing_automation.append({
-                            'instance_name': instance.display_name,
-                            'shape': instance.shape,
-                            'lifecycle_state': instance.lifecycle_state,
-                            'availability_domain': instance.availability_domain,
-                            'time_created': instance.time_created.strftime("%Y-%m-%d %H:%M:%S"),
-                            'compartment_id': compartment_id,
-                            'tags': self.format_tags(instance),
-                            'resource_id': instance.id
-                        })
-                    
-                    # Check for oversized instances
-                    if instance.shape in self.oversized_compute_shapes:
-                        oversized_instances.append({
-                            'instance_name': instance.display_name,
-                            'shape': instance.shape,
-                            'lifecycle_state': instance.lifecycle_state,
-                            'availability_domain': instance.availability_domain,
-                            'time_created': instance.time_created.strftime("%Y-%m-%d %H:%M:%S"),
-                            'compartment_id': compartment_id,
-                            'tags': self.format_tags(instance),
-                            'resource_id': instance.id
-                        })
+                if instance.lifecycle_state not in ('RUNNING', 'STOPPED'):
+                    continue
+                if not is_dev_test(instance):
+                    continue
+
+                # Scan tags and build the shared payload once per instance;
+                # both findings reuse it instead of re-deriving everything
+                base = {
+                    'instance_name': instance.display_name,
+                    'shape': instance.shape,
+                    'lifecycle_state': instance.lifecycle_state,
+                    'availability_domain': instance.availability_domain,
+                    'time_created': instance.time_created.strftime("%Y-%m-%d %H:%M:%S"),
+                    'compartment_id': compartment_id,
+                    'tags': self.format_tags(instance),
+                    'resource_id': instance.id
+                }
+
+                # Check for missing automation tags
+                if not has_automation(instance):
+                    missing_automation.append(base)
+
+                # Check for oversized instances
+                if instance.shape in oversized_shapes:
+                    oversized_instances.append(base.copy())
                         
         except Exception as e:
-            self.logger.warning(f"Error checking compute instances: {str(e)}")
+            self.logger.warning("Error checking compute instances: %s", e)
         
         return missing_automation, oversized_instances
 
-    def check_unattached_volumes(self, compartment_id: str) -> List[Dict[str, Any]]:
+    def check_unattached_volumes(self, compartment_id: str) -> Iterator[Dict[str, Any]]:
         """Check for unattached block volumes."""
-        results = []
         
         try:
-            self.logger.info(f"Checking block volumes in compartment: {compartment_id}")
+            self.logger.info("Checking block volumes in compartment: %s", compartment_id)
             
-            volumes = self.blockstorage_client.list_volumes(compartment_id=compartment_id).data
+            volumes = self._list_all(
+                self.blockstorage_client.list_volumes,
+                compartment_id=compartment_id,
+                lifecycle_state='AVAILABLE',
+                limit=1000
+            )
+
+            # List attachments once for the whole compartment instead of per volume
+            attached_volume_ids = {
+                attachment.volume_id
+                for attachment in self._list_all(
+                    self.compute_client.list_volume_attachments,
+                    compartment_id=compartment_id,
+                    limit=1000
+                )
+                if attachment.lifecycle_state == 'ATTACHED'
+            }
+
             for volume in volumes:
-                if (self.is_dev_test_resource(volume) and 
-                    volume.lifecycle_state == 'AVAILABLE'):
-                    
-                    # Check if volume is attached
-                    attachments = self.compute_client.list_volume_attachments(
-                        compartment_id=compartment_id,
-                        volume_id=volume.id
-                    ).data
-                    
-                    if not attachments:
-                        results.append({
+                if self.is_dev_test_resource(volume):
+
+                    if volume.id not in attached_volume_ids:
+                        yield {
                             'volume_name': volume.display_name,
                             'size_gb': volume.size_in_gbs,
-                            'volume_type': getattr(volume, 'vpus_per_gb', 'Standard'),
+                            'volume_type': volume.vpus_per_gb if volume.vpus_per_gb is not None else 'Standard',
                             'availability_domain': volume.availability_domain,
                             'lifecycle_state': volume.lifecycle_state,
                             'time_created': volume.time_created.strftime("%Y-%m-%d %H:%M:%S"),
                             'compartment_id': compartment_id,
                             'tags': self.format_tags(volume),
                             'resource_id': volume.id
-                        })
+                        }
                         
         except Exception as e:
-            self.logger.warning(f"Error checking block volumes: {str(e)}")
+            self.logger.warning("Error checking block volumes: %s", e)
         
-        return results
 
-    def check_unused_public_ips(self, compartment_id: str) -> List[Dict[str, Any]]:
+    def check_unused_public_ips(self, compartment_id: str) -> Iterator[Dict[str, Any]]:
         """Check for unused public IP addresses."""
-        results = []
         
         try:
-            self.logger.info(f"Checking public IPs in compartment: {compartment_id}")
+            self.logger.info("Checking public IPs in compartment: %s", compartment_id)
             
-            public_ips = self.virtual_network_client.list_public_ips(
+            # list_public_ips has no lifecycle_state parameter, so the
+            # AVAILABLE filter has to stay client-side
+            public_ips = self._list_all(
+                self.virtual_network_client.list_public_ips,
                 scope='REGION',
-                compartment_id=compartment_id
-            ).data
-            
+                compartment_id=compartment_id,
+                limit=1000
+            )
+
             for public_ip in public_ips:
-                if (self.is_dev_test_resource(public_ip) and 
-                    public_ip.lifecycle_state == 'AVAILABLE' and
+                if (public_ip.lifecycle_state == 'AVAILABLE' and
+                    self.is_dev_test_resource(public_ip) and
                     not public_ip.assigned_entity_id):
                     
-                    results.append({
+                    yield {
                         'public_ip_name': public_ip.display_name,
                         'ip_address': public_ip.ip_address,
                         'scope': public_ip.scope,
@@ -356,100 +723,169 @@ class OCIDevTestCostChef:
                         'compartment_id': compartment_id,
                         'tags': self.format_tags(public_ip),
                         'resource_id': public_ip.id
-                    })
+                    }
                     
         except Exception as e:
-            self.logger.warning(f"Error checking public IPs: {str(e)}")
+            self.logger.warning("Error checking public IPs: %s", e)
         
-        return results
 
-    def check_empty_load_balancers(self, compartment_id: str) -> List[Dict[str, Any]]:
+    def check_empty_load_balancers(self, compartment_id: str) -> Iterator[Dict[str, Any]]:
         """Check for load balancers with no backends."""
-        results = []
         
         try:
-            self.logger.info(f"Checking load balancers in compartment: {compartment_id}")
+            self.logger.info("Checking load balancers in compartment: %s", compartment_id)
             
-            load_balancers = self.load_balancer_client.list_load_balancers(compartment_id=compartment_id).data
-            for lb in load_balancers:
-                if (self.is_dev_test_resource(lb) and 
-                    lb.lifecycle_state == 'ACTIVE'):
-                    
-                    # Get backend sets
-                    lb_details = self.load_balancer_client.get_load_balancer(lb.id).data
-                    has_backends = False
-                    
-                    if lb_details.backend_sets:
-                        for backend_set_name, backend_set in lb_details.backend_sets.items():
-                            if backend_set.backends:
-                                has_backends = True
-                                break
+            load_balancers = self._list_all(
+                self.load_balancer_client.list_load_balancers,
+                compartment_id=compartment_id,
+                lifecycle_state='ACTIVE',
+                limit=1000
+            )
+            dev_test_lbs = [lb for lb in load_balancers if self.is_dev_test_resource(lb)]
+
+            # Each backend-set detail fetch is an independent GET, so fan them out
+            details = []
+            if dev_test_lbs:
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    details = list(executor.map(
+                        lambda lb: self.load_balancer_client.get_load_balancer(lb.id).data,
+                        dev_test_lbs
+                    ))
+
+            for lb, lb_details in zip(dev_test_lbs, details):
+                has_backends = False
+
+                if lb_details.backend_sets:
+                    for backend_set_name, backend_set in lb_details.backend_sets.items():
+                        if backend_set.backends:
+                            has_backends = True
+                            break
+
+                if not has_backends:
+                    yield {
+                        'load_balancer_name': lb.display_name,
+                        'shape': lb.shape_name,
+                        'lifecycle_state': lb.lifecycle_state,
+                        'ip_addresses': '; '.join([ip.ip_address for ip in lb.ip_addresses]),
+                        'time_created': lb.time_created.strftime("%Y-%m-%d %H:%M:%S"),
+                        'compartment_id': compartment_id,
+                        'tags': self.format_tags(lb),
+                        'resource_id': lb.id
+                    }
                     
-                    if not has_backends:
-                        results.append({
-                            'load_balancer_name': lb.display_name,
-                            'shape': lb.shape_name,
-                            'lifecycle_state': lb.lifecycle_state,
-                            'ip_addresses': '; '.join([ip.ip_address for ip in lb.ip_addresses]),
-                            'time_created': lb.time_created.strftime("%Y-%m-%d %H:%M:%S"),
-                            'compartment_id': compartment_id,
-                            'tags': self.format_tags(lb),
-                            'resource_id': lb.id
-                        })
-                        
         except Exception as e:
-            self.logger.warning(f"Error checking load balancers: {str(e)}")
+            self.logger.warning("Error checking load balancers: %s", e)
         
-        return results
 
-    def check_permissive_security_lists(self, compartment_id: str) -> List[Dict[str, Any]]:
+    def check_permissive_security_lists(self, compartment_id: str) -> Iterator[Dict[str, Any]]:
         """Check for overly permissive security lists."""
-        results = []
         
         try:
-            self.logger.info(f"Checking security lists in compartment: {compartment_id}")
+            self.logger.info("Checking security lists in compartment: %s", compartment_id)
             
-            # Get VCNs first
-            vcns = self.virtual_network_client.list_vcns(compartment_id=compartment_id).data
-            
-            for vcn in vcns:
-                if vcn.lifecycle_state == 'AVAILABLE':
-                    security_lists = self.virtual_network_client.list_security_lists(
-                        compartment_id=compartment_id,
-                        vcn_id=vcn.id
-                    ).data
-                    
-                    for sec_list in security_lists:
-                        if (self.is_dev_test_resource(sec_list) and 
-                            sec_list.lifecycle_state == 'AVAILABLE'):
-                            
-                            permissive_rules = []
-                            
-                            # Check ingress rules
-                            for rule in sec_list.ingress_security_rules:
-                                if (rule.source == '0.0.0.0/0' and 
-                                    (not rule.tcp_options or 
-                                     (rule.tcp_options.destination_port_range and 
-                                      (rule.tcp_options.destination_port_range.min == 22 or 
-                                       rule.tcp_options.destination_port_range.min == 3389)))):
-                                    permissive_rules.append(f"TCP:{rule.tcp_options.destination_port_range.min if rule.tcp_options and rule.tcp_options.destination_port_range else 'ALL'}")
+            # Get VCNs first; security lists hang off each VCN
+            vcns = self._list_all(
+                self.virtual_network_client.list_vcns,
+                compartment_id=compartment_id,
+                lifecycle_state='AVAILABLE',
+                limit=1000
+            )
+
+            # One list_security_lists call per VCN; fan them out concurrently
+            def list_vcn_security_lists(vcn):
+                return vcn, self._list_all(
+                    self.virtual_network_client.list_security_lists,
+                    compartment_id=compartment_id,
+                    vcn_id=vcn.id,
+                    lifecycle_state='AVAILABLE',
+                    limit=1000
+                )
+
+            sec_lists_per_vcn = []
+            if vcns:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    sec_lists_per_vcn = list(executor.map(list_vcn_security_lists, vcns))
+
+            for vcn, security_lists in sec_lists_per_vcn:
+                for sec_list in security_lists:
+                    if self.is_dev_test_resource(sec_list):
+
+                        # Pre-extract (source, has_tcp_options, port_min) tuples
+                        # once so the filter below is plain comparisons without
+                        # repeated attribute chains
+                        rules = [
+                            (rule.source,
+                             rule.tcp_options is not None,
+                             rule.tcp_options.destination_port_range.min
+                             if rule.tcp_options and rule.tcp_options.destination_port_range
+                             else None)
+                            for rule in sec_list.ingress_security_rules
+                        ]
+
+                        permissive_rules = [
+                            f"TCP:{port if has_tcp else 'ALL'}"
+                            for source, has_tcp, port in rules
+                            if source in _PERMISSIVE_CIDRS and
+                            (not has_tcp or port in _RISKY_PORTS)
+                        ]
+
+                        if permissive_rules:
+                            yield {
+                                'security_list_name': sec_list.display_name,
+                                'vcn_name': vcn.display_name,
+                                'lifecycle_state': sec_list.lifecycle_state,
+                                'permissive_rules_count': len(permissive_rules),
+                                'permissive_rules': '; '.join(permissive_rules),
+                                'compartment_id': compartment_id,
+                                'tags': self.format_tags(sec_list),
+                                'resource_id': sec_list.id
+                            }
                             
-                            if permissive_rules:
-                                results.append({
-                                    'security_list_name': sec_list.display_name,
-                                    'vcn_name': vcn.display_name,
-                                    'lifecycle_state': sec_list.lifecycle_state,
-                                    'permissive_rules_count': len(permissive_rules),
-                                    'permissive_rules': '; '.join(permissive_rules),
-                                    'compartment_id': compartment_id,
-                                    'tags': self.format_tags(sec_list),
-                                    'resource_id': sec_list.id
-                                })
-                                
         except Exception as e:
-            self.logger.warning(f"Error checking security lists: {str(e)}")
+            self.logger.warning("Error checking security lists: %s", e)
         
-        return results
+
+    def _list_all(self, list_call, *args, **kwargs) -> List[Any]:
+        """Run a paginated list call, serving it from the on-disk cache when fresh.
+
+        The cache key covers the client, method, region, and arguments, so
+        re-runs within the TTL (report tweaks, iterative development) skip
+        the API entirely. Disabled with --no-cache.
+        """
+        if not self.cache_dir:
+            return oci.pagination.list_call_get_all_results(list_call, *args, **kwargs).data
+
+        key_source = json.dumps(
+            [list_call.__self__.__class__.__name__, list_call.__name__,
+             self.config.get('region', ''), list(args), kwargs],
+            sort_keys=True, default=str)
+        digest = hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+        cache_path = os.path.join(self.cache_dir, f"{digest}.pkl")
+
+        try:
+            if os.path.getmtime(cache_path) > time.time() - _CACHE_TTL_SECONDS:
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, pickle.PickleError):
+            pass  # Missing, expired, or unreadable entry: fall through to the API
+
+        data = oci.pagination.list_call_get_all_results(list_call, *args, **kwargs).data
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pickle.PickleError) as e:
+            self.logger.debug("Could not write cache entry: %s", e)
+
+        return data
+
+    @staticmethod
+    def _collect(check, compartment_id: str) -> List[Dict[str, Any]]:
+        """Drain a generator-style check into a list."""
+        return list(check(compartment_id))
 
     def analyze_compartment(self, compartment_id: str) -> Dict[str, List[Dict[str, Any]]]:
         """Analyze a single compartment for cost optimization opportunities."""
@@ -463,130 +899,83 @@ class OCIDevTestCostChef:
             'permissive_security_lists': []
         }
         
-        # Check database instances
-        results['database_instances'] = self.check_database_instances(compartment_id)
-        
-        # Check compute instances
-        missing_auto, oversized = self.check_compute_instances(compartment_id)
-        results['compute_missing_automation'] = missing_auto
-        results['oversized_compute'] = oversized
-        
-        # Check unattached volumes
-        results['unattached_volumes'] = self.check_unattached_volumes(compartment_id)
-        
-        # Check unused public IPs
-        results['unused_public_ips'] = self.check_unused_public_ips(compartment_id)
-        
-        # Check empty load balancers
-        results['empty_load_balancers'] = self.check_empty_load_balancers(compartment_id)
-        
-        # Check permissive security lists
-        results['permissive_security_lists'] = self.check_permissive_security_lists(compartment_id)
-        
+        # The checks are independent and I/O-bound, so run them concurrently.
+        # The generator-style checks are drained inside the worker threads.
+        futures = {
+            self._check_executor.submit(self._collect, self.check_database_instances, compartment_id): 'database_instances',
+            self._check_executor.submit(self.check_compute_instances, compartment_id): 'compute_instances',
+            self._check_executor.submit(self._collect, self.check_unattached_volumes, compartment_id): 'unattached_volumes',
+            self._check_executor.submit(self._collect, self.check_unused_public_ips, compartment_id): 'unused_public_ips',
+            self._check_executor.submit(self._collect, self.check_empty_load_balancers, compartment_id): 'empty_load_balancers',
+            self._check_executor.submit(self._collect, self.check_permissive_security_lists, compartment_id): 'permissive_security_lists'
+        }
+
+        for future in as_completed(futures):
+            category = futures[future]
+            if category == 'compute_instances':
+                missing_auto, oversized = future.result()
+                results['compute_missing_automation'] = missing_auto
+                results['oversized_compute'] = oversized
+            else:
+                results[category] = future.result()
+
         return results
 
-    def export_to_csv(self, results: Dict[str, List[Dict[str, Any]]], output_path: str) -> List[str]:
-        """Export results to CSV files."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        csv_files = []
-        
-        report_mappings = {
-            'database_instances': 'Database_Production_Shapes',
-            'compute_missing_automation': 'Compute_Missing_Automation_Tags',
-            'oversized_compute': 'Oversized_Compute_Instances',
-            'unattached_volumes': 'Unattached_Block_Volumes',
-            'unused_public_ips': 'Unused_Public_IPs',
-            'empty_load_balancers': 'Empty_Load_Balancers',
-            'permissive_security_lists': 'Permissive_Security_Lists'
-        }
-        
-        for category, data in results.items():
-            if data:
-                filename = os.path.join(output_path, f"{report_mappings[category]}_{timestamp}.csv")
-                
-                with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                    if data:
-                        fieldnames = data[0].keys()
-                        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                        writer.writeheader()
-                        writer.writerows(data)
-                        
-                csv_files.append(filename)
-                self.logger.info(f"CSV report saved to: {filename}")
-        
-        return csv_files
+    def analyze_all(self, compartments: List[Dict[str, str]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Analyze multiple compartments concurrently and merge their results."""
+        all_results: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        # Seed the known categories so downstream consumers can rely on them
+        # even when no compartment yields results
+        for category in _CSV_REPORT_NAMES:
+            all_results[category]
+
+        if not compartments:
+            return all_results
+
+        with ThreadPoolExecutor(max_workers=min(16, len(compartments))) as executor:
+            futures = {
+                executor.submit(self.analyze_compartment, comp['id']): comp
+                for comp in compartments
+            }
+
+            for future in as_completed(futures):
+                comp = futures[future]
+                try:
+                    comp_results = future.result()
+                except Exception as e:
+                    self.logger.warning("Failed to analyze compartment %s: %s", comp['name'], e)
+                    continue
 
-    def generate_html_report(self, all_results: Dict[str, List[Dict[str, Any]]], 
-                           output_path: str) -> str:
-        """Generate HTML report."""
+                for category, results in comp_results.items():
+                    all_results[category].extend(results)
+
+        return all_results
+
+    def render_reports(self, all_results: Dict[str, List[Dict[str, Any]]],
+                       output_path: str, write_csv: bool = True,
+                       write_html: bool = True) -> tuple:
+        """Write the CSV files and the HTML report in one pass over the results.
+
+        Each category's CSV rows are handed to the writer as one batch and
+        its HTML table is built alongside in the same section loop. Either
+        format can be skipped entirely via write_csv/write_html.
+        Returns (csv_files, html_file); html_file is None when skipped.
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = os.path.join(output_path, f"OCI_DevTest_Resource_Report_{timestamp}.html")
-        
         report_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
+
+        csv_files = []
+        filename = os.path.join(output_path, f"OCI_DevTest_Resource_Report_{timestamp}.html")
+
         # Calculate totals
         total_counts = {k: len(v) for k, v in all_results.items()}
-        total_issues = sum(total_counts.values())
-        
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>OCI Dev/Test Resource Cost Chef Report</title>
-    <style>
-        body {{ 
-            font-family: 'Oracle Sans', 'Helvetica Neue', Arial, sans-serif; 
-            margin: 20px; 
-            background-color: #f7f7f7; 
-        }}
-        .container {{ 
-            background-color: white; 
-            padding: 30px; 
-            border-radius: 8px; 
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1); 
-        }}
-        h1, h2 {{ color: #312d2a; }}
-        h1 {{ border-bottom: 3px solid #ff4800; padding-bottom: 10px; }}
-        table {{ 
-            border-collapse: collapse; 
-            width: 100%; 
-            margin-bottom: 30px; 
-        }}
-        th, td {{ 
-            border: 1px solid #e0e0e0; 
-            padding: 12px; 
-            text-align: left; 
-        }}
-        th {{ 
-            background: linear-gradient(135deg, #312d2a 0%, #ff4800 100%); 
-            color: white; 
-            font-weight: bold; 
-        }}
-        tr:nth-child(even) {{ background-color: #fafafa; }}
-        tr:hover {{ background-color: #fff3e0; }}
-        .summary {{ 
-            background: linear-gradient(135deg, #ff4800 0%, #ff6800 100%); 
-            color: white; 
-            padding: 20px; 
-            border-radius: 8px; 
-            margin-bottom: 20px; 
-        }}
-        .warning {{ color: #d32f2f; font-weight: bold; }}
-        .timestamp {{ color: #666; font-size: 0.9em; }}
-        .footer {{ 
-            margin-top: 30px; 
-            padding-top: 20px; 
-            border-top: 1px solid #e0e0e0; 
-            text-align: center; 
-            color: #666; 
-        }}
-        .metric {{ font-weight: bold; font-size: 1.1em; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🍳 OCI Dev/Test Resource Cost Chef Report</h1>
-        <div class="timestamp">Generated on: {report_timestamp}</div>
+
+        html_out = (open(filename, 'w', encoding='utf-8', buffering=1 << 20)
+                    if write_html else None)
+        try:
+            if html_out is not None:
+                html_out.write(_HTML_HEAD)
+                html_out.write(f"""        <div class="timestamp">Generated on: {report_timestamp}</div>
         
         <div class='summary'>
             <h3 style="margin-top: 0; color: white;">🔍 Cost Optimization Opportunities</h3>
@@ -601,181 +990,43 @@ class OCIDevTestCostChef:
             </div>
         </div>
 
-        <h2>🗄️ Database Instances Using Production-Grade Shapes</h2>"""
-        
-        if all_results['database_instances']:
-            html_content += """<table>
-                <tr>
-                    <th>Resource Type</th><th>Name</th><th>Shape</th><th>State</th>
-                    <th>Availability Domain</th><th>CPU Cores</th><th>Tags</th>
-                </tr>"""
-            for db in all_results['database_instances']:
-                html_content += f"""<tr>
-                    <td>{db['resource_type']}</td>
-                    <td>{db['name']}</td>
-                    <td class='warning'>{db['shape']}</td>
-                    <td>{db['lifecycle_state']}</td>
-                    <td>{db['availability_domain']}</td>
-                    <td>{db['cpu_core_count']}</td>
-                    <td>{db['tags']}</td>
-                </tr>"""
-            html_content += "</table>"
-        else:
-            html_content += "<p>✅ Excellent! All dev/test database instances are using appropriate shapes.</p>"
+""")
+            for section in _REPORT_SECTIONS:
+                category, title, empty_message, header_row, row_fields, row_template = section
+                data = all_results[category]
 
-        html_content += "<h2>🖥️ Compute Instances Missing Automation Tags</h2>"
-        
-        if all_results['compute_missing_automation']:
-            html_content += """<table>
-                <tr>
-                    <th>Instance Name</th><th>Shape</th><th>State</th>
-                    <th>Availability Domain</th><th>Created</th><th>Tags</th>
-                </tr>"""
-            for instance in all_results['compute_missing_automation']:
-                html_content += f"""<tr>
-                    <td>{instance['instance_name']}</td>
-                    <td>{instance['shape']}</td>
-                    <td>{instance['lifecycle_state']}</td>
-                    <td>{instance['availability_domain']}</td>
-                    <td>{instance['time_created']}</td>
-                    <td>{instance['tags']}</td>
-                </tr>"""
-            html_content += "</table>"
-        else:
-            html_content += "<p>✅ All dev/test compute instances have automation tags configured!</p>"
+                # Only render the table markup when it will actually be written
+                if html_out is not None:
+                    html_out.write(_render_section(
+                        title, empty_message, header_row,
+                        _SECTION_ROW_RENDERERS[category], data))
+                if not data or not write_csv:
+                    continue
 
-        html_content += "<h2>🍖 Oversized Compute Instances for Dev/Test</h2>"
-        
-        if all_results['oversized_compute']:
-            html_content += """<table>
-                <tr>
-                    <th>Instance Name</th><th>Shape</th><th>State</th>
-                    <th>Availability Domain</th><th>Created</th><th>Tags</th>
-                </tr>"""
-            for instance in all_results['oversized_compute']:
-                html_content += f"""<tr>
-                    <td>{instance['instance_name']}</td>
-                    <td class='warning'>{instance['shape']}</td>
-                    <td>{instance['lifecycle_state']}</td>
-                    <td>{instance['availability_domain']}</td>
-                    <td>{instance['time_created']}</td>
-                    <td>{instance['tags']}</td>
-                </tr>"""
-            html_content += "</table>"
-        else:
-            html_content += "<p>✅ No oversized compute instances found in dev/test environments!</p>"
+                csv_path = os.path.join(
+                    output_path, f"{_CSV_REPORT_NAMES[category]}_{timestamp}.csv")
 
-        html_content += "<h2>💽 Unattached Block Volumes</h2>"
-        
-        if all_results['unattached_volumes']:
-            html_content += """<table>
-                <tr>
-                    <th>Volume Name</th><th>Size (GB)</th><th>Type</th>
-                    <th>Availability Domain</th><th>Created</th><th>Tags</th>
-                </tr>"""
-            for volume in all_results['unattached_volumes']:
-                html_content += f"""<tr>
-                    <td>{volume['volume_name']}</td>
-                    <td>{volume['size_gb']}</td>
-                    <td>{volume['volume_type']}</td>
-                    <td>{volume['availability_domain']}</td>
-                    <td>{volume['time_created']}</td>
-                    <td>{volume['tags']}</td>
-                </tr>"""
-            html_content += "</table>"
-        else:
-            html_content += "<p>✅ No unattached block volumes found!</p>"
+                fieldnames = list(data[0].keys())
+                get_fields = itemgetter(*fieldnames)
+                with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(fieldnames)
+                    writer.writerows(map(get_fields, data))
 
-        html_content += "<h2>🌐 Unused Public IP Addresses</h2>"
-        
-        if all_results['unused_public_ips']:
-            html_content += """<table>
-                <tr>
-                    <th>Public IP Name</th><th>IP Address</th><th>Scope</th>
-                    <th>Lifetime</th><th>Created</th><th>Tags</th>
-                </tr>"""
-            for ip in all_results['unused_public_ips']:
-                html_content += f"""<tr>
-                    <td>{ip['public_ip_name']}</td>
-                    <td>{ip['ip_address']}</td>
-                    <td>{ip['scope']}</td>
-                    <td>{ip['lifetime']}</td>
-                    <td>{ip['time_created']}</td>
-                    <td>{ip['tags']}</td>
-                </tr>"""
-            html_content += "</table>"
-        else:
-            html_content += "<p>✅ No unused public IP addresses found!</p>"
+                csv_files.append(csv_path)
+                self.logger.info("CSV report saved to: %s", csv_path)
 
-        html_content += "<h2>⚖️ Load Balancers with No Backends</h2>"
-        
-        if all_results['empty_load_balancers']:
-            html_content += """<table>
-                <tr>
-                    <th>Load Balancer Name</th><th>Shape</th><th>State</th>
-                    <th>IP Addresses</th><th>Created</th><th>Tags</th>
-                </tr>"""
-            for lb in all_results['empty_load_balancers']:
-                html_content += f"""<tr>
-                    <td>{lb['load_balancer_name']}</td>
-                    <td>{lb['shape']}</td>
-                    <td>{lb['lifecycle_state']}</td>
-                    <td>{lb['ip_addresses']}</td>
-                    <td>{lb['time_created']}</td>
-                    <td>{lb['tags']}</td>
-                </tr>"""
-            html_content += "</table>"
-        else:
-            html_content += "<p>✅ All load balancers have active backends!</p>"
+            if html_out is not None:
+                html_out.write(_HTML_RECOMMENDATIONS_UL)
+                html_out.write(_HTML_FOOTER_TMPL.format(report_timestamp=report_timestamp))
+        finally:
+            if html_out is not None:
+                html_out.close()
 
-        html_content += "<h2>🔓 Permissive Security Lists</h2>"
-        
-        if all_results['permissive_security_lists']:
-            html_content += """<table>
-                <tr>
-                    <th>Security List Name</th><th>VCN Name</th><th>Permissive Rules</th>
-                    <th>Rule Details</th><th>Tags</th>
-                </tr>"""
-            for sec_list in all_results['permissive_security_lists']:
-                html_content += f"""<tr>
-                    <td>{sec_list['security_list_name']}</td>
-                    <td>{sec_list['vcn_name']}</td>
-                    <td class='warning'>{sec_list['permissive_rules_count']}</td>
-                    <td class='warning'>{sec_list['permissive_rules']}</td>
-                    <td>{sec_list['tags']}</td>
-                </tr>"""
-            html_content += "</table>"
-        else:
-            html_content += "<p>✅ No overly permissive security lists found!</p>"
-
-        html_content += f"""
-        <h2>🍽️ Chef's OCI Cost-Saving Recommendations</h2>
-        <ul>
-            <li><strong>🔽 Database Right-Sizing:</strong> Switch to VM.Standard2.1, VM.Standard.E2.1, or Always Free Autonomous DB for dev/test—production power isn't needed for testing recipes.</li>
-            <li><strong>⏱️ Compute Auto-Shutdown:</strong> Tag instances with automation schedules to stop after hours—your OCI bill will thank you for turning off the oven.</li>
-            <li><strong>📏 Compute Right-Sizing:</strong> Use VM.Standard.E2.1.Micro, VM.Standard2.1, or Always Free shapes for dev/test—no need for large servings when a small plate will do.</li>
-            <li><strong>💽 Block Volume Cleanup:</strong> Delete unattached volumes—these orphaned ingredients are still charging you storage fees.</li>
-            <li><strong>🌐 Release Public IPs:</strong> Return unused public IPs to OCI—each idle IP costs money when not attached to resources.</li>
-            <li><strong>⚖️ Load Balancer Cleanup:</strong> Remove load balancers with no backends—empty serving trays cost money without providing value.</li>
-            <li><strong>🔒 Security List Tightening:</strong> Close unnecessary 0.0.0.0/0 rules—keep your dev kitchen secure without leaving doors wide open.</li>
-            <li><strong>💰 Always Free Resources:</strong> Use OCI Always Free tier for long-running dev/test workloads—it's like getting free ingredients forever!</li>
-            <li><strong>📊 Cost Budgets:</strong> Set up OCI Budget alerts to catch cost spikes before they burn your wallet.</li>
-            <li><strong>🏷️ Preemptible Instances:</strong> Use preemptible compute for fault-tolerant dev/test workloads to save up to 50%.</li>
-        </ul>
-        
-        <div class='footer'>
-            <p>Generated on {report_timestamp}</p>
-            <p>🍳 CloudCostChefs - Serving up OCI savings, one resource at a time</p>
-        </div>
-    </div>
-</body>
-</html>"""
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        self.logger.info(f"HTML report saved to: {filename}")
-        return filename
+        if write_html:
+            self.logger.info(f"HTML report saved to: {filename}")
+            return csv_files, filename
+        return csv_files, None
 
 
 def main():
@@ -798,6 +1049,19 @@ Examples:
                        help='Path to OCI config file (default: ~/.oci/config)')
     parser.add_argument('--profile', type=str,
                        help='OCI config profile to use (default: DEFAULT)')
+    parser.add_argument('--auth', type=str, choices=['config_file', 'instance_principal'],
+                       default='config_file',
+                       help='Authentication method (default: config_file)')
+    parser.add_argument('--region', type=str,
+                       help='Region to scan (default: region from config or instance metadata)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Bypass the on-disk API response cache (.oci_cache)')
+    parser.add_argument('--open', action='store_true', dest='open_report',
+                       help='Open the HTML report in the default browser when done')
+    parser.add_argument('--no-html', action='store_true',
+                       help='Skip generating the HTML report')
+    parser.add_argument('--no-csv', action='store_true',
+                       help='Skip generating the CSV exports')
     parser.add_argument('--verbose', action='store_true',
                        help='Enable debug logging')
     
@@ -813,69 +1077,60 @@ Examples:
     
     try:
         # Initialize cost chef
-        chef = OCIDevTestCostChef(args.config_path, args.profile)
+        chef = OCIDevTestCostChef(args.config_path, args.profile, args.auth, args.region,
+                                  no_cache=args.no_cache)
         
-        # Get compartments to analyze
-        compartments = chef.get_compartments(compartment_ids)
+        # Get compartments to analyze (whole tenancy tree unless an explicit list is given)
+        if compartment_ids:
+            compartments = chef.get_compartments(compartment_ids)
+        else:
+            compartments = chef.discover_all_compartments()
         if not compartments:
             chef.logger.error("No accessible compartments found")
             sys.exit(1)
         
         chef.logger.info(f"Will check compartments: {[c['name'] for c in compartments]}")
         
-        # Aggregate results from all compartments
-        all_results = {
-            'database_instances': [],
-            'compute_missing_automation': [],
-            'oversized_compute': [],
-            'unattached_volumes': [],
-            'unused_public_ips': [],
-            'empty_load_balancers': [],
-            'permissive_security_lists': []
-        }
-        
+        # Analyze all active compartments concurrently
+        active_compartments = []
         for compartment in compartments:
             if compartment['lifecycle_state'] != 'ACTIVE':
                 chef.logger.warning(f"Skipping inactive compartment: {compartment['name']}")
                 continue
-                
-            chef.logger.info(f"Processing compartment: {compartment['name']}")
-            
-            comp_results = chef.analyze_compartment(compartment['id'])
-            
-            # Merge results
-            for category, results in comp_results.items():
-                all_results[category].extend(results)
+            active_compartments.append(compartment)
+
+        all_results = chef.analyze_all(active_compartments)
         
         # Calculate totals
         total_issues = sum(len(results) for results in all_results.values())
         
         if total_issues > 0:
-            # Export to CSV
-            csv_files = chef.export_to_csv(all_results, args.output_path)
-            
-            # Generate HTML report
-            html_file = chef.generate_html_report(all_results, args.output_path)
-            
-            # Try to open HTML report
-            try:
-                webbrowser.open(f'file://{os.path.abspath(html_file)}')
-                chef.logger.info("Opening HTML report in default browser...")
-            except Exception:
-                chef.logger.warning(f"Could not auto-open HTML report. Please open manually: {html_file}")
+            # Write the CSV files and HTML report in a single pass
+            csv_files, html_file = chef.render_reports(
+                all_results, args.output_path,
+                write_csv=not args.no_csv, write_html=not args.no_html)
+
+            # Try to open HTML report if requested
+            if args.open_report and html_file:
+                try:
+                    webbrowser.open(f'file://{os.path.abspath(html_file)}')
+                    chef.logger.info("Opening HTML report in default browser...")
+                except Exception:
+                    chef.logger.warning(f"Could not auto-open HTML report. Please open manually: {html_file}")
         else:
             chef.logger.info("No cost optimization opportunities found in dev/test resources.")
         
-        # Summary output
-        chef.logger.info("🍳 OCI Dev/Test Cost Analysis Complete!")
-        chef.logger.info("Summary:")
-        chef.logger.info(f"- Database instances with production shapes: {len(all_results['database_instances'])}")
-        chef.logger.info(f"- Compute instances missing automation tags: {len(all_results['compute_missing_automation'])}")
-        chef.logger.info(f"- Oversized compute instances: {len(all_results['oversized_compute'])}")
-        chef.logger.info(f"- Unattached block volumes: {len(all_results['unattached_volumes'])}")
-        chef.logger.info(f"- Unused public IP addresses: {len(all_results['unused_public_ips'])}")
-        chef.logger.info(f"- Empty load balancers: {len(all_results['empty_load_balancers'])}")
-        chef.logger.info(f"- Permissive security lists: {len(all_results['permissive_security_lists'])}")
+        # Summary output (single log record so the block is emitted in one write)
+        chef.logger.info(
+            "🍳 OCI Dev/Test Cost Analysis Complete!\n"
+            "Summary:\n"
+            f"- Database instances with production shapes: {len(all_results['database_instances'])}\n"
+            f"- Compute instances missing automation tags: {len(all_results['compute_missing_automation'])}\n"
+            f"- Oversized compute instances: {len(all_results['oversized_compute'])}\n"
+            f"- Unattached block volumes: {len(all_results['unattached_volumes'])}\n"
+            f"- Unused public IP addresses: {len(all_results['unused_public_ips'])}\n"
+            f"- Empty load balancers: {len(all_results['empty_load_balancers'])}\n"
+            f"- Permissive security lists: {len(all_results['permissive_security_lists'])}")
         
         if total_issues > 0:
             chef.logger.info(f"Total cost optimization opportunities found: {total_issues}")